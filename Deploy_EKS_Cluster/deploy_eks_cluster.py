@@ -1,10 +1,70 @@
 # Import libraries
 import boto3  # AWS SDK for Python to interact with AWS services
 import json  # For reading and parsing JSON configuration files.
+import argparse  # For parsing command-line arguments
+import copy  # For isolating cached configuration from caller modifications
 import os  # For accessing environment variables
+import sys  # For exiting with a status code in diagnose mode
 import warnings  # To issue runtime warnings
 import traceback  # For capturing and logging detailed stack traces in error scenarios
 import logging  # For tracking execution flow and errors
+import threading  # For guarding the shared boto3 session across worker threads
+from concurrent.futures import ThreadPoolExecutor  # For running independent AWS calls concurrently
+from types import SimpleNamespace  # For attribute access on validated configuration values
+from functools import lru_cache  # For caching parsed configuration files
+from botocore.config import Config  # For tuning connection pooling and retries
+from botocore.exceptions import BotoCoreError, ClientError  # For handling AWS API errors
+
+# Prefer orjson for faster JSON parsing when it is installed; fall back to the standard library
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared AWS session and client cache
+_SESSION = boto3.Session()  # Loads credentials and service models once per process
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,  # Reuse keep-alive connections across calls
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},  # Back off on throttling
+)
+_CLIENTS = {}  # Clients keyed by (service, region)
+_CLIENTS_LOCK = threading.Lock()  # boto3 sessions are not thread-safe
+
+# AWS error codes that indicate throttling or a transient outage; these are re-raised
+# after the client's own retries are exhausted instead of being silently swallowed
+RETRYABLE_ERROR_CODES = frozenset(
+    (
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+    )
+)
+
+# Keys that every environment configuration must define
+REQUIRED_KEYS = frozenset(
+    (
+        "cluster_name",
+        "role_arn",
+        "subnet_ids",
+        "security_group_ids",
+        "autoscaling_group_name",
+        "desired_capacity",
+    )
+)
+
+# Required keys where zero is a valid value, so only None counts as missing
+NUMERIC_KEYS = frozenset(("desired_capacity",))
+
+# Deployment environments that have a configuration file
+ENVIRONMENTS = ("dev", "staging", "production")
 
 # Configure logging settings to output execution information and errors
 logging.basicConfig(
@@ -14,6 +74,69 @@ logging.basicConfig(
 )
 
 
+@lru_cache(maxsize=8)
+def _load_raw(path, mtime):
+    """
+    Read and parse a JSON configuration file, cached by path and modification time.
+
+    Parameters:
+        path (str): Absolute path to the JSON configuration file.
+        mtime (float): Modification time of the file, so edits invalidate the cache.
+
+    Returns:
+        dict: The parsed configuration. Shared by all callers, so it must not be modified;
+        load_config returns a deep copy.
+    """
+    with open(path, "rb") as file:
+        return _json_loads(file.read())
+
+
+def _has_value(key, value):
+    """
+    Check whether a required configuration value is set.
+
+    Parameters:
+        key (str): Configuration key being checked.
+        value: Value stored under the key.
+
+    Returns:
+        bool: True if the value is set; numeric keys only need to be non-None.
+    """
+    if key in NUMERIC_KEYS:
+        return value is not None
+    return bool(value)
+
+
+def is_config_valid(config):
+    """
+    Quickly check whether a configuration defines every required key.
+
+    Parameters:
+        config (dict): Configuration settings to check.
+
+    Returns:
+        bool: False as soon as a missing or empty required key is found, True otherwise.
+    """
+    # Cheap set check for absent keys first, then make sure none of them are empty
+    return REQUIRED_KEYS <= config.keys() and all(
+        _has_value(key, config[key]) for key in REQUIRED_KEYS
+    )
+
+
+def diagnose_config(config):
+    """
+    List every required key that is missing or empty in a configuration.
+
+    Parameters:
+        config (dict): Configuration settings to check.
+
+    Returns:
+        list: Names of the missing or invalid required keys, sorted alphabetically.
+    """
+    present = {key for key, value in config.items() if _has_value(key, value)}
+    return sorted(REQUIRED_KEYS - present)
+
+
 def load_config(environment):
     """
     Load configuration settings for a specific environment (e.g., 'dev', 'staging', 'production').
@@ -23,9 +146,10 @@ def load_config(environment):
 
     Returns:
         dict: A dictionary containing merged configuration settings loaded from a JSON file and environment variables.
+        Required keys are not checked here; use is_config_valid or diagnose_config.
 
     Raises:
-        ValueError: If the environment name is missing or required keys in the configuration are invalid.
+        ValueError: If the environment name is missing.
     """
     if not environment:
         raise ValueError("Environment parameter is required and cannot be empty!")
@@ -36,9 +160,11 @@ def load_config(environment):
 
     # Load configuration from a JSON file
     try:
-        with open(config_file, "r") as file:
-            config = json.load(file)
-        logging.info(f"Successfully loaded configuration file: {config_file}")
+        # Key the cache on the absolute path so a change of working directory
+        # cannot return another file's cached contents
+        config_path = os.path.abspath(config_file)
+        config = copy.deepcopy(_load_raw(config_path, os.path.getmtime(config_path)))
+        logging.info("Successfully loaded configuration file: %s", config_file)
     except FileNotFoundError:
         warnings.warn(
             f"Configuration file '{config_file}' not found. Verify the file path.",
@@ -64,23 +190,6 @@ def load_config(environment):
     config["api_key"] = os.getenv("API_KEY", None)  # Fetch API key
     config["db_password"] = os.getenv("DB_PASSWORD", None)  # Fetch database password
 
-    # Define a list of required keys for the configuration
-    required_keys = [
-        "cluster_name",
-        "role_arn",
-        "subnet_ids",
-        "security_group_ids",
-        "autoscaling_group_name",
-        "desired_capacity",
-    ]
-
-    # Check if all required keys are present and valid in the configuration
-    for key in required_keys:
-        if key not in config or not config[key]:
-            warnings.warn(
-                f"Missing or invalid required configuration key: {key}", RuntimeWarning
-            )
-
     # Issue warnings for any missing sensitive data
     if not config.get("api_key"):
         warnings.warn(
@@ -96,6 +205,46 @@ def load_config(environment):
     return config
 
 
+def _client(service, region):
+    """
+    Return a cached AWS client for the given service and region. Safe to call from threads.
+
+    Parameters:
+        service (str): AWS service name (e.g., 'eks', 'cloudwatch').
+        region (str): AWS region for the client.
+
+    Returns:
+        botocore.client.BaseClient: A client built from the shared session.
+    """
+    key = (service, region)
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _SESSION.client(
+                    service, region_name=region, config=_CLIENT_CONFIG
+                )
+                _CLIENTS[key] = client
+    return client
+
+
+def _is_retryable(error):
+    """
+    Check whether an AWS error is transient (throttling or service unavailability).
+
+    Parameters:
+        error (Exception): Error raised by a boto3 client call.
+
+    Returns:
+        bool: True if the error code is listed in RETRYABLE_ERROR_CODES.
+    """
+    return (
+        isinstance(error, ClientError)
+        and error.response.get("Error", {}).get("Code") in RETRYABLE_ERROR_CODES
+    )
+
+
 def create_eks_cluster(
     cluster_name, role_arn, subnet_ids, security_group_ids, region="us-east-1"
 ):
@@ -121,7 +270,7 @@ def create_eks_cluster(
         )
 
     try:
-        eks_client = boto3.client("eks", region_name=region)
+        eks_client = _client("eks", region)
         response = eks_client.create_cluster(
             name=cluster_name,
             roleArn=role_arn,
@@ -130,12 +279,12 @@ def create_eks_cluster(
                 "securityGroupIds": security_group_ids,
             },
         )
-        logging.info(f"EKS cluster '{cluster_name}' creation initiated successfully.")
+        logging.info("EKS cluster '%s' creation initiated successfully.", cluster_name)
         return response
-    except Exception:
-        logging.error(
-            f"Failed to create the EKS cluster '{cluster_name}':\n{traceback.format_exc()}"
-        )
+    except (ClientError, BotoCoreError) as error:
+        if _is_retryable(error):
+            raise
+        logging.error("Failed to create the EKS cluster '%s': %s", cluster_name, error)
         return {}
 
 
@@ -155,7 +304,7 @@ def configure_cloudwatch(cluster_name, namespace, region="us-east-1"):
         raise ValueError("Both 'cluster_name' and 'namespace' are required!")
 
     try:
-        cloudwatch_client = boto3.client("cloudwatch", region_name=region)
+        cloudwatch_client = _client("cloudwatch", region)
         cloudwatch_client.put_metric_alarm(
             AlarmName=f"{cluster_name}_Health",
             MetricName="ClusterHealth",
@@ -169,10 +318,12 @@ def configure_cloudwatch(cluster_name, namespace, region="us-east-1"):
             ],  # Replace with your actual SNS ARN
             Statistic="Average",
         )
-        logging.info(f"CloudWatch alarm configured for cluster '{cluster_name}'.")
-    except Exception:
+        logging.info("CloudWatch alarm configured for cluster '%s'.", cluster_name)
+    except (ClientError, BotoCoreError) as error:
+        if _is_retryable(error):
+            raise
         logging.error(
-            f"Failed to configure CloudWatch for cluster '{cluster_name}':\n{traceback.format_exc()}"
+            "Failed to configure CloudWatch for cluster '%s': %s", cluster_name, error
         )
 
 
@@ -197,56 +348,108 @@ def scale_worker_nodes(autoscaling_group_name, desired_capacity, region="us-east
         )
 
     try:
-        autoscaling_client = boto3.client("autoscaling", region_name=region)
+        autoscaling_client = _client("autoscaling", region)
         response = autoscaling_client.set_desired_capacity(
             AutoScalingGroupName=autoscaling_group_name,
             DesiredCapacity=desired_capacity,
             HonorCooldown=True,
         )
         logging.info(
-            f"Auto Scaling Group '{autoscaling_group_name}' scaled to {desired_capacity} instances."
+            "Auto Scaling Group '%s' scaled to %s instances.",
+            autoscaling_group_name,
+            desired_capacity,
         )
         return response
-    except Exception:
+    except (ClientError, BotoCoreError) as error:
+        if _is_retryable(error):
+            raise
         logging.error(
-            f"Failed to scale worker nodes in Auto Scaling Group '{autoscaling_group_name}':\n{traceback.format_exc()}"
+            "Failed to scale worker nodes in Auto Scaling Group '%s': %s",
+            autoscaling_group_name,
+            error,
         )
         return {}
 
 
+def parse_args(argv=None):
+    """
+    Parse command-line arguments for the deployment script.
+
+    Parameters:
+        argv (list): Arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: Parsed arguments with 'env' and 'diagnose' attributes.
+    """
+    parser = argparse.ArgumentParser(
+        description="Deploy an EKS cluster for the given environment."
+    )
+    parser.add_argument(
+        "--env",
+        choices=ENVIRONMENTS,
+        default=os.getenv("DEPLOY_ENV"),
+        help="Deployment environment (defaults to the DEPLOY_ENV environment variable).",
+    )
+    parser.add_argument(
+        "--diagnose",
+        action="store_true",
+        help="List every missing required configuration key and exit without deploying.",
+    )
+    args = parser.parse_args(argv)
+    if args.env not in ENVIRONMENTS:
+        parser.error(
+            f"--env (or DEPLOY_ENV) must be one of: {', '.join(ENVIRONMENTS)}"
+        )
+    return args
+
+
 # Main execution entry point
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        # Prompt user for environment and load corresponding configuration
-        environment = input(
-            "Enter the environment (dev, staging, production): "
-        ).strip()
-        config = load_config(environment)
+        # Load the configuration for the requested environment
+        config = load_config(args.env)
         if not config:
             raise Exception("Configuration could not be loaded. Exiting program.")
 
+        # In diagnose mode, report every missing key and stop without deploying
+        if args.diagnose:
+            missing = diagnose_config(config)
+            print("Missing or invalid configuration keys:", missing or "none")
+            sys.exit(1 if missing else 0)
+
+        # Bail out early on an incomplete configuration
+        if not is_config_valid(config):
+            raise Exception(
+                "Configuration is missing required keys. Run with --diagnose for details."
+            )
+        settings = SimpleNamespace(**{key: config.get(key) for key in REQUIRED_KEYS})
+
         # Create an EKS cluster
         create_response = create_eks_cluster(
-            cluster_name=config.get("cluster_name"),
-            role_arn=config.get("role_arn"),
-            subnet_ids=config.get("subnet_ids"),
-            security_group_ids=config.get("security_group_ids"),
+            cluster_name=settings.cluster_name,
+            role_arn=settings.role_arn,
+            subnet_ids=settings.subnet_ids,
+            security_group_ids=settings.security_group_ids,
         )
         print("EKS Cluster Creation Response:", create_response)
 
-        # Configure CloudWatch monitoring
-        configure_cloudwatch(
-            cluster_name=config.get("cluster_name"), namespace="AWS/EKS"
-        )
-
-        # Scale worker nodes in the cluster
-        scaling_response = scale_worker_nodes(
-            autoscaling_group_name=config.get("autoscaling_group_name"),
-            desired_capacity=config.get("desired_capacity"),
-        )
+        # Configure CloudWatch monitoring and scale worker nodes concurrently,
+        # since neither call depends on the other
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            cloudwatch_future = executor.submit(
+                configure_cloudwatch,
+                cluster_name=settings.cluster_name,
+                namespace="AWS/EKS",
+            )
+            scaling_future = executor.submit(
+                scale_worker_nodes,
+                autoscaling_group_name=settings.autoscaling_group_name,
+                desired_capacity=settings.desired_capacity,
+            )
+            cloudwatch_future.result()  # Re-raise any error from CloudWatch setup
+            scaling_response = scaling_future.result()
         print("Scaling Response:", scaling_response)
 
     except Exception:
-        logging.critical(
-            f"Critical error occurred during execution:\n{traceback.format_exc()}"
-        )
+        logging.critical("Critical error occurred during execution.", exc_info=True)
@@ -9,9 +9,6 @@ from diagrams.aws.network import CloudFront
 from diagrams.cicd import GithubActions
 from diagrams.programming.language import Python
 
-import pandas as pd
-import plotly.graph_objects as go  # For creating 3D interactive visualizations
-
 # Data for AWS infrastructure visualization
 data = {
     "Account": [
@@ -25,72 +22,79 @@ data = {
     "NAT Gateways": [1, 1, 2, 3],  # NAT Gateways for outbound Internet access
 }
 
-# Create a Pandas DataFrame to organize data
-df = pd.DataFrame(data)
+
+# Workload accounts in the diagram, with whether their database runs Multi-AZ
+ENVIRONMENTS = (
+    ("Development", False),
+    ("Staging", False),
+    ("Production", True),
+)
 
 
 # Function for 3D motion visualization
-def visualize_3d_motion(dataframe):
+def visualize_3d_motion(resources):
     """
     Create an interactive 3D scatter plot with multiple colors for AWS infrastructure resources.
-    :param dataframe: A Pandas DataFrame containing AWS account data and resource counts.
+    :param resources: A dict of lists containing AWS account names and resource counts.
     """
-    fig = go.Figure()
-
-    # Add scatter points for EKS Clusters using a blue color scheme
-    fig.add_trace(
+    # Import NumPy and Plotly lazily so importing this module does not pay their load cost
+    import numpy as np
+    import plotly.graph_objects as go  # For creating 3D interactive visualizations
+
+    # Convert columns to NumPy arrays once so Plotly can take its array fast path
+    accounts = np.asarray(resources["Account"])
+    eks_clusters = np.asarray(resources["EKS Clusters"])
+    rds_instances = np.asarray(resources["RDS Instances"])
+    nat_gateways = np.asarray(resources["NAT Gateways"])
+
+    traces = [
+        # Scatter points for EKS Clusters using a blue color scheme
         go.Scatter3d(
-            x=dataframe["Account"],  # X-axis: AWS Accounts
-            y=dataframe["EKS Clusters"],  # Y-axis: EKS Clusters count
-            z=dataframe["NAT Gateways"],  # Z-axis: NAT Gateways count
+            x=accounts,  # X-axis: AWS Accounts
+            y=eks_clusters,  # Y-axis: EKS Clusters count
+            z=nat_gateways,  # Z-axis: NAT Gateways count
             mode="markers",
             marker=dict(
                 size=10,
-                color=dataframe["EKS Clusters"],  # Blue color gradient
+                color=eks_clusters,  # Blue color gradient
                 colorscale="Blues",  # Apply blue colors
                 opacity=0.8,
             ),
             name="EKS Clusters (Blue)",
-        )
-    )
-
-    # Add scatter points for RDS Instances using a green color scheme
-    fig.add_trace(
+        ),
+        # Scatter points for RDS Instances using a green color scheme
         go.Scatter3d(
-            x=dataframe["Account"],
-            y=dataframe["RDS Instances"],
-            z=dataframe["NAT Gateways"],
+            x=accounts,
+            y=rds_instances,
+            z=nat_gateways,
             mode="markers+lines",
             marker=dict(
                 size=8,
-                color=dataframe["RDS Instances"],  # Green color gradient
+                color=rds_instances,  # Green color gradient
                 colorscale="Greens",  # Apply green colors
                 opacity=0.8,
             ),
             line=dict(color="green", width=2),  # Green connecting lines
             name="RDS Instances (Green)",
-        )
-    )
-
-    # Add scatter points for NAT Gateways using a red color scheme
-    fig.add_trace(
+        ),
+        # Scatter points for NAT Gateways using a red color scheme
         go.Scatter3d(
-            x=dataframe["Account"],
-            y=dataframe["NAT Gateways"],
-            z=dataframe["EKS Clusters"],
+            x=accounts,
+            y=nat_gateways,
+            z=eks_clusters,
             mode="markers",
             marker=dict(
                 size=6,
-                color=dataframe["NAT Gateways"],  # Red color gradient
+                color=nat_gateways,  # Red color gradient
                 colorscale="Reds",  # Apply red colors
                 opacity=0.7,
             ),
             name="NAT Gateways (Red)",
-        )
-    )
+        ),
+    ]
 
     # Layout customization for better visuals
-    fig.update_layout(
+    layout = go.Layout(
         title="3D Motion Visualization of AWS Resources (Multi-Color)",
         scene=dict(
             xaxis_title="AWS Account",  # Label for X-axis
@@ -107,77 +111,64 @@ def visualize_3d_motion(dataframe):
         ),
     )
 
+    # Build the figure in a single call instead of adding traces one by one
+    fig = go.Figure(data=traces, layout=layout)
+
     # Show the interactive 3D plot
     fig.show()
 
 
 # Infrastructure Diagram using the Diagrams library
-with Diagram("Innovate Inc. Infrastructure", show=True, direction="TB"):
-    # AWS Accounts
-    management_account = Organizations("Management Account")
-    dev_account = Organizations("Development Account")
-    staging_account = Organizations("Staging Account")
-    prod_account = Organizations("Production Account")
-
-    # Management Account Resources
-    with Cluster("Management Account"):
-        management_vpc = VPC("Management VPC")
-        ClientVpn("VPN Gateway") - management_vpc
-
-    #
-    # Development Account Resources
-    with Cluster("Development Account"):
-        dev_vpc = VPC("Development VPC")
-        dev_public = PublicSubnet("Public Subnet")
-        dev_private = PrivateSubnet("Private Subnet")
-        nat_gateway_dev = NATGateway("NAT Gateway")
-        eks_dev = EKS("Development EKS Cluster")
-        rds_dev = RDS("Development RDS")
-        dev_vpc >> [dev_public, dev_private]
-        dev_private >> eks_dev >> rds_dev
-        dev_public >> nat_gateway_dev
-
-    # Staging Account Resources
-    with Cluster("Staging Account"):
-        staging_vpc = VPC("Staging VPC")
-        staging_public = PublicSubnet("Public Subnet")
-        staging_private = PrivateSubnet("Private Subnet")
-        nat_gateway_staging = NATGateway("NAT Gateway")
-        eks_staging = EKS("Staging EKS Cluster")
-        rds_staging = RDS("Staging RDS")
-        staging_vpc >> [staging_public, staging_private]
-        staging_private >> eks_staging >> rds_staging
-        staging_public >> nat_gateway_staging
-
-    # Production Account Resources
-    with Cluster("Production Account"):
-        prod_vpc = VPC("Production VPC")
-        prod_public = PublicSubnet("Public Subnet")
-        prod_private = PrivateSubnet("Private Subnet")
-        nat_gateway_prod = NATGateway("NAT Gateway")
-        eks_prod = EKS("Production EKS Cluster")
-        rds_prod = RDS("Production RDS (Multi-AZ)")
-        prod_vpc >> [prod_public, prod_private]
-        prod_private >> eks_prod >> rds_prod
-        prod_public >> nat_gateway_prod
-
-    # Static Frontend Hosting
-    with Cluster("Frontend Hosting"):
-        cloudfront = CloudFront("CloudFront CDN")
-        s3_static = S3("React Static Assets")
-        cloudfront >> s3_static
-
-    # CI/CD Pipeline Integration
-    with Cluster("CI/CD Integration"):
-        github_ci = GithubActions("GitHub Actions")
-        argo_cd = Python("Argo CD")
-        github_ci >> argo_cd >> [EKS("Deploy to EKS Clusters")]
-
-    # Connectivity between Accounts and Frontend Hosting
-    management_account >> [dev_account, staging_account, prod_account]
-    prod_account >> cloudfront
+def build_diagram():
+    """
+    Render the Innovate Inc. infrastructure diagram with Graphviz via the Diagrams library.
+    """
+    with Diagram("Innovate Inc. Infrastructure", show=True, direction="TB"):
+        # AWS Accounts
+        management_account = Organizations("Management Account")
+        env_accounts = {
+            name: Organizations(f"{name} Account") for name, _ in ENVIRONMENTS
+        }
+
+        # Management Account Resources
+        with Cluster("Management Account"):
+            management_vpc = VPC("Management VPC")
+            ClientVpn("VPN Gateway") - management_vpc
+
+        # Development, Staging and Production Account Resources
+        for name, multi_az in ENVIRONMENTS:
+            with Cluster(f"{name} Account"):
+                vpc = VPC(f"{name} VPC")
+                public = PublicSubnet("Public Subnet")
+                private = PrivateSubnet("Private Subnet")
+                nat_gateway = NATGateway("NAT Gateway")
+                eks = EKS(f"{name} EKS Cluster")
+                rds = RDS(f"{name} RDS (Multi-AZ)" if multi_az else f"{name} RDS")
+                vpc >> [public, private]
+                private >> eks >> rds
+                public >> nat_gateway
+
+        # Static Frontend Hosting
+        with Cluster("Frontend Hosting"):
+            cloudfront = CloudFront("CloudFront CDN")
+            s3_static = S3("React Static Assets")
+            cloudfront >> s3_static
+
+        # CI/CD Pipeline Integration
+        with Cluster("CI/CD Integration"):
+            github_ci = GithubActions("GitHub Actions")
+            argo_cd = Python("Argo CD")
+            github_ci >> argo_cd >> [EKS("Deploy to EKS Clusters")]
+
+        # Connectivity between Accounts and Frontend Hosting
+        management_account >> list(env_accounts.values())
+        env_accounts["Production"] >> cloudfront
+
 
 # Main Execution
 if __name__ == "__main__":
+    # Generate the infrastructure diagram
+    build_diagram()
+
     # Generate the 3D motion visualization
-    visualize_3d_motion(df)
+    visualize_3d_motion(data)
@@ -19,18 +19,85 @@ import warnings
 # botocore is a low-level, foundational library used by boto3 to make HTTP requests to AWS services.
 # The ClientError exception specifically is used to catch and handle errors returned by AWS services,
 # such as invalid permissions, resource not found, or service failures. This helps in providing meaningful error handling.
-from botocore.exceptions import ClientError
+# BotoCoreError covers client-side failures such as connection errors and waiters that time out.
+from botocore.exceptions import BotoCoreError, ClientError
 
-# Importing the Thread class from Python's threading module.
-# Threading allows concurrent execution of code in separate threads, which can improve performance for tasks
-# that might otherwise block the main program (e.g., waiting for cluster creation to complete).
-# In this script, threading is used to deploy EKS clusters or perform other tasks without blocking the main program flow.
-from threading import Thread
+# Importing ThreadPoolExecutor from concurrent.futures to deploy several clusters at the same time.
+# boto3 releases the GIL while waiting on AWS, so threads overlap the network round-trips of each deployment.
+from concurrent.futures import ThreadPoolExecutor
+
+# Importing Config from botocore.config to tune the underlying HTTP connection pool and retry behaviour.
+# Importing cached_property from functools so each instance only builds the clients it actually uses.
+# Importing threading so clients are created under a lock, since boto3 sessions are not thread-safe.
+from botocore.config import Config
+from functools import cached_property
+import threading
+
+# Prefer orjson for faster JSON parsing when it is installed.
+# Its decode errors subclass json.JSONDecodeError, so existing error handling still applies.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 # Enable warnings to notify users about potential issues in the script
 warnings.simplefilter("always", UserWarning)
 
+# Keys that must be present in the cluster configuration file
+_REQUIRED_CONFIG_KEYS = frozenset(("vpcConfig", "nodeRoleArn", "subnets"))
+
+# Trust relationship policy allowing the EKS service to assume the cluster role.
+# It never changes, so it is serialized once in its most compact form.
+_EKS_TRUST_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "eks.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    },
+    separators=(",", ":"),
+)
+
+# AWS clients are built once per service and region from a single shared session.
+# The client configuration keeps HTTP connections alive in a pool and backs off adaptively
+# when AWS throttles requests. Creation is locked because boto3 sessions are not thread-safe.
+_SESSION = boto3.Session()
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _client(service, region):
+    """
+    Return the cached AWS client for the given service and region, creating it on first use.
+
+    :param service: AWS service name (e.g., 'eks', 'iam').
+    :param region: AWS region for the client.
+    :return: A boto3 client for the requested service.
+    """
+    key = (service, region)
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)  # Another thread may have created it meanwhile
+            if client is None:
+                client = _SESSION.client(
+                    service, region_name=region, config=_CLIENT_CONFIG
+                )
+                _CLIENTS[key] = client
+    return client
+
 
 # Define a class to encapsulate the entire EKS Cluster setup process
 class EKSClusterSetup:
@@ -42,7 +109,7 @@ class EKSClusterSetup:
 
     def __init__(self, cluster_name, region, config_file):
         """
-        Initialize the class and set up AWS client connections.
+        Initialize the class. AWS clients are created lazily on first use.
 
         :param cluster_name: The name of the EKS cluster to be created.
         :param region: The AWS region where the cluster will be deployed.
@@ -51,12 +118,26 @@ class EKSClusterSetup:
         self.cluster_name = cluster_name  # Name of the EKS cluster
         self.region = region  # AWS region for the cluster
         self.config_file = config_file  # Path to the configuration file
-        self.eks_client = boto3.client("eks", region_name=self.region)  # AWS EKS client
-        self.iam_client = boto3.client("iam", region_name=self.region)  # AWS IAM client
-        self.sts_client = boto3.client("sts", region_name=self.region)  # AWS STS client
         self.validated = (
             False  # Flag to indicate whether the configuration is validated
         )
+        self._config = None  # Parsed configuration, cached by validate_config
+        self._role_arn = None  # ARN of the IAM role, cached by create_iam_role
+
+    @cached_property
+    def eks_client(self):
+        """AWS EKS client, created on first access."""
+        return _client("eks", self.region)
+
+    @cached_property
+    def iam_client(self):
+        """AWS IAM client, created on first access."""
+        return _client("iam", self.region)
+
+    @cached_property
+    def sts_client(self):
+        """AWS STS client, created on first access."""
+        return _client("sts", self.region)
 
     def validate_config(self):
         """
@@ -71,16 +152,17 @@ class EKSClusterSetup:
         """
         try:
             # Open and load the configuration file
-            with open(self.config_file, "r") as file:
-                config = json.load(file)
+            with open(self.config_file, "rb") as file:
+                config = _json_loads(file.read())
                 print("Configuration loaded successfully.")  # Indicate successful load
+            self._config = config  # Cache the parsed configuration for later steps
 
-            # List of required keys that must be in the configuration file
-            required_keys = ["vpcConfig", "nodeRoleArn", "subnets"]
-            for key in required_keys:
-                # Check if any required key is missing
-                if key not in config:
-                    raise ValueError(f"Missing {key} in the configuration file.")
+            # Check for any required keys missing from the configuration file
+            missing = _REQUIRED_CONFIG_KEYS - config.keys()
+            if missing:
+                raise ValueError(
+                    f"Missing {', '.join(sorted(missing))} in the configuration file."
+                )
 
             self.validated = True  # Mark the configuration as valid
         except FileNotFoundError:
@@ -106,21 +188,10 @@ class EKSClusterSetup:
         """
         try:
             print("Creating IAM role...")  # Notify user about role creation
-            # Define the trust relationship policy for the EKS service
+            # Create the role with the trust relationship policy for the EKS service
             response = self.iam_client.create_role(
                 RoleName=f"{self.cluster_name}-role",  # Unique role name
-                AssumeRolePolicyDocument=json.dumps(
-                    {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Principal": {"Service": "eks.amazonaws.com"},
-                                "Action": "sts:AssumeRole",
-                            }
-                        ],
-                    }
-                ),
+                AssumeRolePolicyDocument=_EKS_TRUST_POLICY,  # Precomputed trust policy
             )
             print("IAM Role created successfully.")  # Confirm success
             return response["Role"]["Arn"]  # Return the role ARN
@@ -144,15 +215,17 @@ class EKSClusterSetup:
             if not self.validated:
                 raise RuntimeError("Configuration not validated.")
 
+            # Create the IAM role only once so a retried cluster creation reuses it
+            if self._role_arn is None:
+                self._role_arn = self.create_iam_role()
+
             print("Creating EKS cluster...")  # Notify user about cluster creation
             # Use the EKS client to create the cluster
             self.eks_client.create_cluster(
                 name=self.cluster_name,  # Cluster name
                 version="1.27",  # Kubernetes version
-                roleArn=self.create_iam_role(),  # IAM role ARN
-                resourcesVpcConfig=json.load(open(self.config_file))[
-                    "vpcConfig"
-                ],  # VPC settings
+                roleArn=self._role_arn,  # IAM role ARN
+                resourcesVpcConfig=self._config["vpcConfig"],  # VPC settings
             )
             print("EKS Cluster creation initiated.")  # Indicate process start
         except ClientError as error:
@@ -162,22 +235,20 @@ class EKSClusterSetup:
 
     def monitor_cluster_status(self):
         """
-        Continuously monitors the status of the EKS cluster creation process.
-        Prints updates on the cluster's status until it becomes active.
+        Waits for the EKS cluster creation process to finish.
+        Uses the built-in 'cluster_active' waiter, which polls at a fixed interval
+        instead of continuously calling the EKS API, until the cluster becomes active.
         """
         try:
             print("Monitoring cluster status...")  # Notify user about monitoring start
-            while True:
-                # Describe the cluster to fetch its current status
-                response = self.eks_client.describe_cluster(name=self.cluster_name)
-                status = response["cluster"]["status"]  # Extract status information
-                print(f"Cluster status: {status}")  # Print the current status
-
-                # Exit the loop when the cluster status is 'ACTIVE'
-                if status == "ACTIVE":
-                    print("Cluster is ready.")  # Confirm readiness
-                    break
-        except Exception as e:
+            waiter = self.eks_client.get_waiter("cluster_active")
+            # Poll every 30 seconds for up to 20 minutes
+            waiter.wait(
+                name=self.cluster_name,
+                WaiterConfig={"Delay": 30, "MaxAttempts": 40},
+            )
+            print("Cluster is ready.")  # Confirm readiness
+        except (ClientError, BotoCoreError) as e:
             # Handle monitoring errors
             print(f"Error monitoring cluster: {e}")
             raise
@@ -191,6 +262,8 @@ class EKSClusterSetup:
         - Monitoring cluster status.
 
         Handles all common errors gracefully with appropriate error messages.
+
+        :return: True if the deployment completed, False if it failed.
         """
         try:
             print("Starting deployment...")  # Notify user about the start
@@ -198,24 +271,50 @@ class EKSClusterSetup:
             self.create_eks_cluster()  # Create the EKS cluster
             self.monitor_cluster_status()  # Monitor the cluster's status
             print("Deployment completed successfully.")  # Notify on success
+            return True
         except PermissionError:
             # Handle permission-related issues
             print("Permission error detected.")
         except Exception as e:
             # Handle generic exceptions
             print(f"Deployment failed: {e}")
+        return False
+
+
+def deploy_clusters(setups, max_workers=None):
+    """
+    Deploy several EKS clusters concurrently (e.g., development, staging and production).
+    Deployments in the same region share one cached client and its connection pool,
+    so wall time is close to the slowest deployment rather than the sum of all of them.
+
+    :param setups: Iterable of EKSClusterSetup instances to deploy.
+    :param max_workers: Maximum number of concurrent deployments (defaults to one per cluster).
+    :return: A dict mapping each cluster name to True if it deployed, False if it failed.
+    """
+    setups = list(setups)
+    if len(setups) <= 1:
+        # Nothing to overlap, so skip the thread pool
+        return {setup.cluster_name: setup.deploy() for setup in setups}
+    with ThreadPoolExecutor(max_workers=max_workers or len(setups)) as executor:
+        results = executor.map(EKSClusterSetup.deploy, setups)
+        return {
+            setup.cluster_name: succeeded for setup, succeeded in zip(setups, results)
+        }
 
 
 # Example Usage Section
 if __name__ == "__main__":
     # Define key parameters for the cluster deployment
-    cluster_name = "MyEKSCluster"  # Name of the cluster
     region = "us-east-1"  # AWS region for deployment
-    config_file = "eks_config.json"  # Path to the JSON configuration file
-
-    # Initialize the EKSClusterSetup class with specified parameters
-    setup = EKSClusterSetup(cluster_name, region, config_file)
-    # Use threading to deploy the cluster in a separate thread for efficiency
-    setup_thread = Thread(target=setup.deploy)
-    setup_thread.start()  # Start the deployment thread
-    setup_thread.join()  # Wait for the deployment to finish
+    # (cluster name, path to its JSON configuration file); add entries to deploy more clusters
+    clusters = [("MyEKSCluster", "eks_config.json")]
+
+    # Initialize an EKSClusterSetup for each cluster and deploy them concurrently
+    setups = [EKSClusterSetup(name, region, config) for name, config in clusters]
+    results = deploy_clusters(setups)
+
+    # Report failed deployments and exit with an error status if there were any
+    failed = [name for name, succeeded in results.items() if not succeeded]
+    if failed:
+        print(f"Failed deployments: {', '.join(failed)}")
+        raise SystemExit(1)